@@ -21,7 +21,8 @@ from .pyfftw import (
         simd_alignment,
         n_byte_align_empty,
         n_byte_align,
-        is_n_byte_aligned,)
+        is_n_byte_aligned,
+        estimate,)
 
 from . import builders
 from . import interfaces
@@ -54,7 +54,7 @@ _default_dtype = numpy.dtype('float64')
 
 def _Xfftn(a, s, axes, overwrite_input, 
         planner_effort, threads, auto_align_input, auto_contiguous, 
-        avoid_copy, inverse, real):
+        avoid_copy, inverse, real, norm=None):
     '''Generic transform interface for all the transforms. No
     defaults exist. The transform must be specified exactly.
     '''
@@ -76,25 +76,31 @@ def _Xfftn(a, s, axes, overwrite_input,
 
     a_is_complex = numpy.iscomplexobj(a)
 
+    # A forward complex transform of a real array is taken as a real 
+    # transform into the full complex output array (with the redundant
+    # half filled in from the Hermitian symmetry), rather than upcasting
+    # the input array to complex.
+    real_input = not inverse and (real or not a_is_complex)
+
     # Make the input dtype correct
     if a.dtype not in _rc_dtype_pairs:
         # We make it the default dtype
-        if not real or inverse:
+        if not real_input:
             # It's going to be complex
             a = numpy.asarray(a, dtype=_rc_dtype_pairs[_default_dtype])
         else:
             a = numpy.asarray(a, dtype=_default_dtype)
     
-    elif not (real and not inverse) and not a_is_complex:
+    elif not real_input and not a_is_complex:
         # We need to make it a complex dtype
         a = numpy.asarray(a, dtype=_rc_dtype_pairs[a.dtype])
 
-    elif (real and not inverse) and a_is_complex:
+    elif real_input and a_is_complex:
         # It should be real
         a = numpy.asarray(a, dtype=_rc_dtype_pairs[a.dtype])
 
     # Make the output dtype correct
-    if not real:
+    if not real and not real_input:
         output_dtype = a.dtype
     
     else:
@@ -133,7 +139,7 @@ def _Xfftn(a, s, axes, overwrite_input,
 
         FFTW_object = _FFTWWrapper(input_array, output_array, axes, direction,
                 flags, threads, input_array_slicer=update_input_array_slicer,
-                FFTW_array_slicer=FFTW_array_slicer)
+                FFTW_array_slicer=FFTW_array_slicer, norm=norm)
 
         # We copy the data back into the internal FFTW object array
         internal_array = FFTW_object.input_array
@@ -172,7 +178,7 @@ def _Xfftn(a, s, axes, overwrite_input,
 
 
         FFTW_object = pyfftw.FFTW(input_array, output_array, axes, direction,
-                flags, threads)
+                flags, threads, norm=norm)
 
         if not avoid_copy:
             # Copy the data back into the (likely) destroyed array
@@ -214,7 +220,7 @@ class _FFTWWrapper(pyfftw.FFTW):
                 axes, direction, flags, threads, *args, **kwargs)
 
     def __call__(self, input_array=None, output_array=None, 
-            normalise_idft=True):
+            normalise_idft=True, norm=None):
         '''Wrap :meth:`pyfftw.FFTW.__call__` by firstly slicing the 
         passed-in input array and then copying it into a sliced version
         of the internal array. These slicers are set at instantiation.
@@ -223,8 +229,8 @@ class _FFTWWrapper(pyfftw.FFTW):
         a copy. Consequently, the alignment and dtype are maintained in
         the internal array.
 
-        ``output_array`` and ``normalise_idft`` are passed through to
-        :meth:`pyfftw.FFTW.__call__` untouched.
+        ``output_array``, ``normalise_idft`` and ``norm`` are passed
+        through to :meth:`pyfftw.FFTW.__call__` untouched.
         '''
 
         if input_array is not None:
@@ -240,6 +246,15 @@ class _FFTWWrapper(pyfftw.FFTW):
             sliced_internal = internal_input_array[self._FFTW_array_slicer]
             sliced_input = input_array[self._input_array_slicer]
 
+            if (numpy.iscomplexobj(input_array) and 
+                    not numpy.iscomplexobj(internal_input_array) and
+                    self.input_shape == self.output_shape):
+                # Casting would silently discard the imaginary part
+                raise ValueError('Invalid input dtype: '
+                        'The object takes a real transform into a full '
+                        'complex output array, so cannot be called '
+                        'with a complex input array.')
+
             if sliced_internal.shape != sliced_input.shape:
                 raise ValueError('Invalid input shape: '
                         'The new input array should be the same shape '
@@ -249,7 +264,8 @@ class _FFTWWrapper(pyfftw.FFTW):
             sliced_internal[:] = sliced_input
 
         output = super(_FFTWWrapper, self).__call__(input_array=None,
-                output_array=output_array, normalise_idft=normalise_idft)
+                output_array=output_array, normalise_idft=normalise_idft,
+                norm=norm)
 
         return output
 
@@ -69,6 +69,18 @@ array is passed to a real transform routine, or vice-versa), then an
 attempt is made to convert the array to an array of the correct
 complexity. This results in a copy being made.
 
+The exception to this is a real array that is passed to one of the
+forward complex transforms (``fft``, ``fft2`` or ``fftn``). In that
+case no conversion is made; the returned object takes a real to complex
+transform into a full sized complex output array, and the redundant
+half of the output is filled in from the Hermitian symmetry of the
+spectrum. This needs half the memory and about half the computation
+of the equivalent complex transform. The returned object expects real
+input arrays on subsequent calls; calling it with a complex array raises
+a ``ValueError`` (rather than discarding the imaginary part). To get
+an object that takes complex input, pass a complex array in the first
+place.
+
 Although the array that is internal to the :class:`pyfftw.FFTW` object
 will be correctly loaded with the values within the input array, it is
 not necessarily the case that the internal array *is* the input array.
@@ -233,6 +245,12 @@ following additional keyword arguments:
   influences a copy during the creation of the object. It changes no
   flags in the :class:`pyfftw.FFTW` object.
 
+* ``norm``: The default normalisation mode of the returned
+  :class:`pyfftw.FFTW` object, as per the ``norm`` argument to
+  :class:`pyfftw.FFTW`. This is one of ``'backward'`` (the default),
+  ``'ortho'``, ``'forward'`` or ``'none'``, and sets the scaling that is
+  applied when the object is called.
+
 The exceptions raised by each of these functions are as per their
 equivalents in :mod:`numpy.fft`, or as documented above.
 '''
@@ -247,7 +265,7 @@ __all__ = ['fft','ifft', 'fft2', 'ifft2', 'fftn',
 def fft(a, n=None, axis=-1, overwrite_input=False, 
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 1D FFT.
     
     The first three arguments are as per :func:`numpy.fft.fft`; 
@@ -261,12 +279,12 @@ def fft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def ifft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 1D 
     inverse FFT.
     
@@ -282,13 +300,13 @@ def ifft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 
 def fft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 2D FFT.
     
     The first three arguments are as per :func:`numpy.fft.fft2`; 
@@ -302,12 +320,12 @@ def fft2(a, s=None, axes=(-2,-1), overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def ifft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 
     2D inverse FFT.
     
@@ -322,13 +340,13 @@ def ifft2(a, s=None, axes=(-2,-1), overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 
 def fftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a n-D FFT.
     
     The first three arguments are as per :func:`numpy.fft.fftn`; 
@@ -342,12 +360,12 @@ def fftn(a, s=None, axes=None, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def ifftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing an n-D 
     inverse FFT.
     
@@ -362,12 +380,12 @@ def ifftn(a, s=None, axes=None, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def rfft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 1D 
     real FFT.
     
@@ -384,12 +402,12 @@ def rfft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def irfft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 1D 
     real inverse FFT.
     
@@ -406,12 +424,12 @@ def irfft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def rfft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 2D 
     real FFT.
     
@@ -425,12 +443,12 @@ def rfft2(a, s=None, axes=(-2,-1), overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 def irfft2(a, s=None, axes=(-2,-1),
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing a 2D 
     real inverse FFT.
     
@@ -447,13 +465,13 @@ def irfft2(a, s=None, axes=(-2,-1),
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 
 def rfftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing an n-D 
     real FFT.
     
@@ -468,13 +486,13 @@ def rfftn(a, s=None, axes=None, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 
 def irfftn(a, s=None, axes=None,
         planner_effort='FFTW_MEASURE', threads=1,
         auto_align_input=True, auto_contiguous=True,
-        avoid_copy=False):
+        avoid_copy=False, norm=None):
     '''Return a :class:`pyfftw.FFTW` object representing an n-D 
     real inverse FFT.
     
@@ -491,7 +509,7 @@ def irfftn(a, s=None, axes=None,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            avoid_copy, inverse, real)
+            avoid_copy, inverse, real, norm)
 
 
 
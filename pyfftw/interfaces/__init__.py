@@ -211,6 +211,14 @@ different defaults.
 
   The default is ``True``.
 
+* ``norm``: The normalisation mode, which is one of ``'backward'``,
+  ``'ortho'``, ``'forward'`` or ``'none'``, as per the ``norm`` argument
+  to :class:`pyfftw.FFTW`. The scaling is applied in place to the output
+  array, so no additional copy is made. This argument is only offered
+  by :mod:`~pyfftw.interfaces.numpy_fft`.
+
+  The default is ``None``, which is equivalent to ``'backward'``.
+
 '''
 
 from . import (
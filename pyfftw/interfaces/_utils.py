@@ -24,17 +24,27 @@ Utility functions for the interfaces routines
 
 import pyfftw.builders as builders
 import pyfftw
+from pyfftw.pyfftw import _scale_and_conjugate
 import numpy
 from . import cache
 
 def _Xfftn(a, s, axes, overwrite_input, planner_effort,
         threads, auto_align_input, auto_contiguous, 
-        calling_func, normalise_idft=True):
+        calling_func, normalise_idft=True, norm=None, 
+        conjugate_input=False):
 
     reload_after_transform = False
 
     a = numpy.asanyarray(a)
 
+    # Conjugating real data does nothing
+    conjugate_input = conjugate_input and numpy.iscomplexobj(a)
+
+    if conjugate_input:
+        # The conjugate is always loaded into an array that belongs to 
+        # the FFTW object, so that array can be overwritten.
+        overwrite_input = True
+
     try:
         s = tuple(s)
     except TypeError:
@@ -92,8 +102,13 @@ def _Xfftn(a, s, axes, overwrite_input, planner_effort,
 
         if cache.is_enabled():
             cache._fftw_cache.insert(FFTW_object, key)
-        
-        output_array = FFTW_object(normalise_idft=normalise_idft)
+
+        if conjugate_input and not _load_conjugate(FFTW_object, a):
+            output_array = FFTW_object(numpy.conjugate(a), 
+                    normalise_idft=normalise_idft, norm=norm)
+        else:
+            output_array = FFTW_object(normalise_idft=normalise_idft, 
+                    norm=norm)
 
     else:
         if reload_after_transform:
@@ -107,10 +122,65 @@ def _Xfftn(a, s, axes, overwrite_input, planner_effort,
         output_array = pyfftw.n_byte_align_empty(output_shape, 
                 output_alignment, output_dtype)
 
-        FFTW_object(input_array=a, output_array=output_array, 
-                normalise_idft=normalise_idft)
+        if conjugate_input and _load_conjugate(FFTW_object, a):
+            input_array = None
+        elif conjugate_input:
+            input_array = numpy.conjugate(a)
+        else:
+            input_array = a
+
+        FFTW_object(input_array=input_array, output_array=output_array, 
+                normalise_idft=normalise_idft, norm=norm)
     
     if reload_after_transform:
         a[:] = a_copy
 
     return output_array
+
+def _load_conjugate(FFTW_object, a):
+    '''Load the complex conjugate of ``a`` into the internal input array
+    of ``FFTW_object`` in a single pass (without the GIL where possible), 
+    rather than conjugating into an intermediate array that is then 
+    copied in.
+
+    If the internal input array is ``a`` itself (which the builders do
+    when they can), a new internal input array is set first so that ``a``
+    is not overwritten. That is only possible if ``a`` is contiguous;
+    if it is not, nothing is done and ``False`` is returned.
+    '''
+    internal_array = FFTW_object.input_array
+    is_wrapper = isinstance(FFTW_object, builders._utils._FFTWWrapper)
+
+    if numpy.may_share_memory(internal_array, a):
+        if internal_array.flags['C_CONTIGUOUS']:
+            order = 'C'
+        elif internal_array.flags['F_CONTIGUOUS']:
+            order = 'F'
+        else:
+            return False
+
+        internal_array = pyfftw.n_byte_align_empty(internal_array.shape,
+                FFTW_object.input_alignment, internal_array.dtype, 
+                order=order)
+
+        if is_wrapper:
+            # Make sure the padding is zero
+            internal_array[:] = 0
+
+        FFTW_object.update_arrays(internal_array, FFTW_object.output_array)
+
+    if is_wrapper:
+        if FFTW_object._input_destroyed:
+            internal_array[:] = 0
+
+        sliced_internal = internal_array[
+                tuple(FFTW_object._FFTW_array_slicer)]
+        sliced_input = a[tuple(FFTW_object._input_array_slicer)]
+
+    else:
+        sliced_internal = internal_array
+        sliced_input = a
+
+    _scale_and_conjugate(sliced_input, 1.0, True, sliced_internal)
+
+    return True
@@ -44,6 +44,8 @@ which this may not be true.
 '''
 
 from ._utils import _Xfftn
+from ..pyfftw import (_scale_and_conjugate, _validate_norm, 
+        _normalisation_scaling)
 
 # Complete the namespace (these are not actually used in this module)
 from numpy.fft import fftfreq, fftshift, ifftshift
@@ -53,9 +55,16 @@ __all__ = ['fft','ifft', 'fft2', 'ifft2', 'fftn', 'ifftn',
            'rfft', 'irfft', 'rfft2', 'irfft2', 'rfftn', 'irfftn',
            'hfft', 'ihfft', 'fftfreq', 'fftshift', 'ifftshift']
 
+# The hermitian transforms are computed using the real transforms in the
+# opposite direction, so the sense of the normalisation is reversed.
+_hermitian_norms = {'backward': 'forward',
+        'ortho': 'ortho',
+        'forward': 'backward',
+        'none': 'none'}
+
 def fft(a, n=None, axis=-1, overwrite_input=False, 
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 1D FFT.
     
     The first three arguments are as per :func:`numpy.fft.fft`; 
@@ -67,11 +76,11 @@ def fft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, n, axis, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def ifft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 1D inverse FFT.
     
     The first three arguments are as per :func:`numpy.fft.ifft`; 
@@ -82,12 +91,12 @@ def ifft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, n, axis, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 
 def fft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 2D FFT.
     
     The first three arguments are as per :func:`numpy.fft.fft2`; 
@@ -98,11 +107,11 @@ def fft2(a, s=None, axes=(-2,-1), overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def ifft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 2D inverse FFT.
     
     The first three arguments are as per :func:`numpy.fft.ifft2`; 
@@ -113,12 +122,12 @@ def ifft2(a, s=None, axes=(-2,-1), overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 
 def fftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform an n-D FFT.
     
     The first three arguments are as per :func:`numpy.fft.fftn`; 
@@ -129,11 +138,11 @@ def fftn(a, s=None, axes=None, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def ifftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform an n-D inverse FFT.
     
     The first three arguments are as per :func:`numpy.fft.ifftn`; 
@@ -144,11 +153,11 @@ def ifftn(a, s=None, axes=None, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def rfft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 1D real FFT.
     
     The first three arguments are as per :func:`numpy.fft.rfft`; 
@@ -159,11 +168,11 @@ def rfft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, n, axis, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def irfft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 1D real inverse FFT.
     
     The first three arguments are as per :func:`numpy.fft.irfft`; 
@@ -174,11 +183,11 @@ def irfft(a, n=None, axis=-1, overwrite_input=False,
 
     return _Xfftn(a, n, axis, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def rfft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 2D real FFT.
     
     The first three arguments are as per :func:`numpy.fft.rfft2`; 
@@ -189,11 +198,11 @@ def rfft2(a, s=None, axes=(-2,-1), overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def irfft2(a, s=None, axes=(-2,-1), overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 2D real inverse FFT.
     
     The first three arguments are as per :func:`numpy.fft.irfft2`; 
@@ -204,12 +213,12 @@ def irfft2(a, s=None, axes=(-2,-1), overwrite_input=False,
     
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 
 def rfftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform an n-D real FFT.
     
     The first three arguments are as per :func:`numpy.fft.rfftn`; 
@@ -220,12 +229,12 @@ def rfftn(a, s=None, axes=None, overwrite_input=False,
 
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 
 def irfftn(a, s=None, axes=None, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform an n-D real inverse FFT.
     
     The first three arguments are as per :func:`numpy.fft.rfftn`; 
@@ -236,11 +245,11 @@ def irfftn(a, s=None, axes=None, overwrite_input=False,
     
     return _Xfftn(a, s, axes, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func)
+            calling_func, norm=norm)
 
 def hfft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 1D FFT of a signal with hermitian symmetry.
     This yields a real output spectrum. See :func:`numpy.fft.hfft`
     for more information.
@@ -251,20 +260,21 @@ def hfft(a, n=None, axis=-1, overwrite_input=False,
     '''
 
     # The hermitian symmetric transform is equivalent to the 
-    # irfft of the conjugate of the input (do the maths!) without
-    # any normalisation of the result (so normalise_idft is set to 
-    # False).
-    a = numpy.conjugate(a)
+    # irfft of the conjugate of the input (do the maths!) with the
+    # sense of the normalisation reversed (so by default no 
+    # normalisation is applied to the result). The conjugate is 
+    # written straight into the internal input array of the FFTW object.
+    irfft_norm = _hermitian_norms[_validate_norm(norm)]
 
     calling_func = 'irfft'
 
     return _Xfftn(a, n, axis, overwrite_input, planner_effort,
             threads, auto_align_input, auto_contiguous, 
-            calling_func, normalise_idft=False)
+            calling_func, norm=irfft_norm, conjugate_input=True)
 
 def ihfft(a, n=None, axis=-1, overwrite_input=False,
         planner_effort='FFTW_MEASURE', threads=1,
-        auto_align_input=True, auto_contiguous=True):
+        auto_align_input=True, auto_contiguous=True, norm=None):
     '''Perform a 1D inverse FFT of a real-spectrum, yielding
     a signal with hermitian symmetry. See :func:`numpy.fft.ihfft`
     for more information.
@@ -276,16 +286,22 @@ def ihfft(a, n=None, axis=-1, overwrite_input=False,
 
     # Result is equivalent to the conjugate of the output of
     # the rfft of a.
-    # It is necessary to perform the inverse scaling, as this
-    # is not done by rfft.
+    # The inverse scaling is not done by rfft, so it is applied at
+    # the same time as the conjugation, in a single pass over the
+    # output array.
+    norm = _validate_norm(norm)
+
     if n is None:
         if not isinstance(a, numpy.ndarray):
             a = numpy.asarray(a)
 
         n = a.shape[axis]
 
-    scaling = 1.0/n
+    scaling = _normalisation_scaling(norm, n, True)
+
+    output_array = rfft(a, n, axis, overwrite_input, planner_effort,
+            threads, auto_align_input, auto_contiguous, norm='none')
 
-    return scaling * rfft(a, n, axis, overwrite_input, planner_effort,
-            threads, auto_align_input, auto_contiguous).conj()
+    _scale_and_conjugate(output_array, scaling, True)
 
+    return output_array
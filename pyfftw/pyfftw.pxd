@@ -18,6 +18,7 @@
 
 cimport numpy as np
 from libc.stdint cimport int64_t
+from libc.stdio cimport FILE
 
 ctypedef struct _fftw_iodim:
     int _n
@@ -217,6 +218,23 @@ cdef extern from 'fftw3.h':
     void fftwf_forget_wisdom()
     void fftwl_forget_wisdom()
 
+    # plan information functions
+    void fftw_flops(fftw_plan, double *add, double *mul, double *fma)
+    void fftwf_flops(fftwf_plan, double *add, double *mul, double *fma)
+    void fftwl_flops(fftwl_plan, double *add, double *mul, double *fma)
+
+    double fftw_estimate_cost(fftw_plan)
+    double fftwf_estimate_cost(fftwf_plan)
+    double fftwl_estimate_cost(fftwl_plan)
+
+    double fftw_cost(fftw_plan)
+    double fftwf_cost(fftwf_plan)
+    double fftwl_cost(fftwl_plan)
+
+    void fftw_fprint_plan(fftw_plan, FILE *output_file)
+    void fftwf_fprint_plan(fftwf_plan, FILE *output_file)
+    void fftwl_fprint_plan(fftwl_plan, FILE *output_file)
+
     double FFTW_NO_TIMELIMIT
 
 # Define function pointers that can act as a placeholder
@@ -239,6 +257,13 @@ ctypedef void (*fftw_generic_plan_with_nthreads)(int n)
 
 ctypedef void (*fftw_generic_set_timelimit)(double seconds)
 
+ctypedef void (*fftw_generic_flops)(void *_plan, 
+        double *add, double *mul, double *fma)
+
+ctypedef double (*fftw_generic_cost)(void *_plan)
+
+ctypedef void (*fftw_generic_fprint_plan)(void *_plan, FILE *output_file)
+
 ctypedef bint (*validator)(np.ndarray input_array, 
         np.ndarray output_array, int64_t *axes, int64_t *not_axes, 
         int64_t axes_length)
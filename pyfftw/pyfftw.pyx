@@ -19,7 +19,9 @@
 import numpy as np
 cimport numpy as np
 from libc.stdlib cimport calloc, malloc, free
+from libc.stdio cimport FILE, tmpfile, fclose, ftell, rewind, fread
 from libc.stdint cimport intptr_t, int64_t
+from libc.math cimport sqrt
 from libc cimport limits
 
 import warnings
@@ -47,6 +49,10 @@ flag_dict = {'FFTW_MEASURE': FFTW_MEASURE,
 
 _flag_dict = flag_dict.copy()
 
+# The valid normalisation modes
+cdef object _norm_modes
+_norm_modes = ('backward', 'ortho', 'forward', 'none')
+
 # Function wrappers
 # =================
 # All of these have the same signature as the fftw_generic functions
@@ -308,6 +314,38 @@ cdef fftw_generic_set_timelimit * _build_set_timelimit_funcs_list():
     set_timelimit_funcs[2] = (
             <fftw_generic_set_timelimit>&fftwl_set_timelimit)
 
+# Plan flop counters
+cdef fftw_generic_flops flops_funcs[3]
+
+cdef fftw_generic_flops * _build_flops_funcs_list():
+    flops_funcs[0] = <fftw_generic_flops>&fftw_flops
+    flops_funcs[1] = <fftw_generic_flops>&fftwf_flops
+    flops_funcs[2] = <fftw_generic_flops>&fftwl_flops
+
+# Plan cost estimators (from the planner's model of the plan)
+cdef fftw_generic_cost estimate_cost_funcs[3]
+
+cdef fftw_generic_cost * _build_estimate_cost_funcs_list():
+    estimate_cost_funcs[0] = <fftw_generic_cost>&fftw_estimate_cost
+    estimate_cost_funcs[1] = <fftw_generic_cost>&fftwf_estimate_cost
+    estimate_cost_funcs[2] = <fftw_generic_cost>&fftwl_estimate_cost
+
+# Plan costs (as measured by the planner)
+cdef fftw_generic_cost cost_funcs[3]
+
+cdef fftw_generic_cost * _build_cost_funcs_list():
+    cost_funcs[0] = <fftw_generic_cost>&fftw_cost
+    cost_funcs[1] = <fftw_generic_cost>&fftwf_cost
+    cost_funcs[2] = <fftw_generic_cost>&fftwl_cost
+
+# Plan printers
+cdef fftw_generic_fprint_plan fprint_plan_funcs[3]
+
+cdef fftw_generic_fprint_plan * _build_fprint_plan_funcs_list():
+    fprint_plan_funcs[0] = <fftw_generic_fprint_plan>&fftw_fprint_plan
+    fprint_plan_funcs[1] = <fftw_generic_fprint_plan>&fftwf_fprint_plan
+    fprint_plan_funcs[2] = <fftw_generic_fprint_plan>&fftwl_fprint_plan
+
 
 # Data validators table
 cdef validator validators[2]
@@ -337,9 +375,12 @@ cdef bint _validate_r2c_arrays(np.ndarray input_array,
             return False
     
     # The critical axis is the last of those over which the 
-    # FFT is taken.
+    # FFT is taken. This is either the non-redundant half of the
+    # output or the full (Hermitian symmetric) output.
     if not (out_shape[axes[axes_length-1]]
-            == in_shape[axes[axes_length-1]]//2 + 1):
+            == in_shape[axes[axes_length-1]]//2 + 1 or
+            out_shape[axes[axes_length-1]]
+            == in_shape[axes[axes_length-1]]):
         return False
 
     for n in range(input_array.ndim - axes_length):
@@ -487,6 +528,10 @@ _build_executor_list()
 _build_nthreads_plan_setters_list()
 _build_validators_list()
 _build_set_timelimit_funcs_list()
+_build_flops_funcs_list()
+_build_estimate_cost_funcs_list()
+_build_cost_funcs_list()
+_build_fprint_plan_funcs_list()
 
 fftw_init_threads()
 fftwf_init_threads()
@@ -569,6 +614,318 @@ cdef void make_axes_unique(int64_t *axes, int64_t axes_length,
     return
 
 
+# Post-processing kernels
+# =======================
+#
+# These apply a scaling and (optionally) a complex conjugation to 
+# contiguous data in a single pass without the GIL, reading from ``_src``
+# and writing to ``_dst`` (which can be the same). ``length`` is the
+# number of real values (so twice the number of elements for complex
+# data). Conjugation is only meaningful for complex data, for which
+# the real and imaginary parts are interleaved.
+#
+# Single precision
+cdef void _scale_conjugate_float(void *_src, void *_dst, Py_ssize_t length,
+        double scaling, bint conjugate) nogil:
+
+    cdef float *src = <float *>_src
+    cdef float *dst = <float *>_dst
+    cdef float _scaling = <float>scaling
+    cdef Py_ssize_t n
+
+    if conjugate:
+        for n in range(0, length, 2):
+            dst[n] = src[n] * _scaling
+            dst[n + 1] = src[n + 1] * -_scaling
+    else:
+        for n in range(length):
+            dst[n] = src[n] * _scaling
+
+# Double precision
+cdef void _scale_conjugate_double(void *_src, void *_dst, Py_ssize_t length,
+        double scaling, bint conjugate) nogil:
+
+    cdef double *src = <double *>_src
+    cdef double *dst = <double *>_dst
+    cdef double _scaling = scaling
+    cdef Py_ssize_t n
+
+    if conjugate:
+        for n in range(0, length, 2):
+            dst[n] = src[n] * _scaling
+            dst[n + 1] = src[n + 1] * -_scaling
+    else:
+        for n in range(length):
+            dst[n] = src[n] * _scaling
+
+# Long double precision
+cdef void _scale_conjugate_longdouble(void *_src, void *_dst, 
+        Py_ssize_t length, double scaling, bint conjugate) nogil:
+
+    cdef long double *src = <long double *>_src
+    cdef long double *dst = <long double *>_dst
+    cdef long double _scaling = <long double>scaling
+    cdef Py_ssize_t n
+
+    if conjugate:
+        for n in range(0, length, 2):
+            dst[n] = src[n] * _scaling
+            dst[n + 1] = src[n + 1] * -_scaling
+    else:
+        for n in range(length):
+            dst[n] = src[n] * _scaling
+
+ctypedef void (*_generic_scale_conjugate)(void *_src, void *_dst, 
+        Py_ssize_t length, double scaling, bint conjugate) nogil
+
+cdef object _scale_conjugate_lookup
+_scale_conjugate_lookup = {
+        np.dtype('float32'): 0,
+        np.dtype('float64'): 1,
+        np.dtype('longdouble'): 2}
+
+# Scale and conjugate kernel table (indexed as per the lookup above)
+cdef _generic_scale_conjugate scale_conjugate_funcs[3]
+
+cdef _generic_scale_conjugate * _build_scale_conjugate_funcs_list():
+    scale_conjugate_funcs[0] = &_scale_conjugate_float
+    scale_conjugate_funcs[1] = &_scale_conjugate_double
+    scale_conjugate_funcs[2] = &_scale_conjugate_longdouble
+
+_build_scale_conjugate_funcs_list()
+
+cdef bint _same_contiguous_layout(np.ndarray array, np.ndarray output_array):
+    ''' Return whether both arrays are contiguous with the same memory
+    order, such that they can be walked through together linearly.
+    '''
+    if array.flags['C_CONTIGUOUS'] and output_array.flags['C_CONTIGUOUS']:
+        return True
+
+    return (array.flags['F_CONTIGUOUS'] and 
+            output_array.flags['F_CONTIGUOUS'])
+
+cpdef _scale_and_conjugate(np.ndarray array, double scaling, 
+        bint conjugate, np.ndarray output_array=None):
+    '''_scale_and_conjugate(array, scaling, conjugate, output_array=None)
+
+    Multiply ``array`` by ``scaling`` and, if ``conjugate`` is ``True`` 
+    and the array is complex, conjugate it at the same time. The result
+    is written to ``output_array``, which should be the same shape and
+    dtype as ``array``. If ``output_array`` is ``None``, the operation is
+    in-place.
+
+    If the arrays are contiguous, this is done in a single pass over the
+    data without the GIL. Otherwise numpy is used to do the same thing.
+    '''
+    cdef bint is_complex = np.PyArray_ISCOMPLEX(array)
+    cdef Py_ssize_t length
+    cdef void *src
+    cdef void *dst
+    cdef _generic_scale_conjugate scale_conjugate_func
+
+    if output_array is None:
+        output_array = array
+
+    elif not (output_array.shape == array.shape and 
+            output_array.dtype == array.dtype):
+        raise ValueError('Invalid output array: '
+                'The output array should be the same shape and dtype '
+                'as the input array.')
+
+    if not is_complex:
+        conjugate = False
+
+    if scaling == 1.0 and not conjugate:
+        if output_array is not array:
+            output_array[...] = array
+
+        return
+
+    real_dtype = array.real.dtype
+
+    if (real_dtype in _scale_conjugate_lookup and 
+            _same_contiguous_layout(array, output_array)):
+
+        scale_conjugate_func = scale_conjugate_funcs[
+                _scale_conjugate_lookup[real_dtype]]
+
+        length = array.size
+        if is_complex:
+            length *= 2
+
+        src = np.PyArray_DATA(array)
+        dst = np.PyArray_DATA(output_array)
+
+        with nogil:
+            scale_conjugate_func(src, dst, length, scaling, conjugate)
+
+    else:
+        if conjugate:
+            np.conjugate(array, out=output_array)
+
+        elif output_array is not array:
+            output_array[...] = array
+
+        if scaling != 1.0:
+            output_array *= scaling
+
+def _validate_norm(norm):
+    '''_validate_norm(norm)
+
+    Return the normalisation mode named by ``norm``, with ``None`` meaning 
+    ``'backward'``. ``ValueError`` is raised if ``norm`` is not a valid 
+    mode.
+    '''
+    if norm is None:
+        return 'backward'
+
+    try:
+        if norm in _norm_modes:
+            return norm
+
+    except (TypeError, ValueError):
+        # e.g. an array, which can't be compared as a truth value
+        pass
+
+    raise ValueError('Invalid norm: ' + '\'' + str(norm) + 
+            '\' is not a valid normalisation mode.')
+
+def _normalisation_scaling(norm, N, inverse):
+    '''_normalisation_scaling(norm, N, inverse)
+
+    Return the scaling that the (valid) normalisation mode ``norm`` 
+    applies to the output of a DFT whose axes have lengths with product 
+    ``N``. ``inverse`` is whether the DFT is the inverse (backward) DFT.
+    '''
+    if norm == 'ortho':
+        return 1.0/sqrt(N)
+
+    elif ((norm == 'backward' and inverse) or 
+            (norm == 'forward' and not inverse)):
+        return 1.0/N
+
+    return 1.0
+
+# Hermitian completion kernels
+# ============================
+#
+# A real to complex transform only computes the non-redundant half of 
+# the last transformed axis. These fill in the rest of a full sized
+# complex output array from the Hermitian symmetry of the spectrum:
+#
+# X[k_0, ..., k_(r-1)] = conj(X[-k_0 % n_0, ..., -k_(r-1) % n_(r-1)])
+#
+# The conjugate line functions copy the conjugate of ``count`` complex
+# elements from ``src`` to ``dst``, with the strides given in bytes.
+#
+# Single precision
+cdef void _conjugate_line_float(char *dst, Py_ssize_t dst_stride,
+        char *src, Py_ssize_t src_stride, Py_ssize_t count) nogil:
+
+    cdef Py_ssize_t n
+
+    for n in range(count):
+        (<float *>dst)[0] = (<float *>src)[0]
+        (<float *>dst)[1] = -(<float *>src)[1]
+        dst += dst_stride
+        src += src_stride
+
+# Double precision
+cdef void _conjugate_line_double(char *dst, Py_ssize_t dst_stride,
+        char *src, Py_ssize_t src_stride, Py_ssize_t count) nogil:
+
+    cdef Py_ssize_t n
+
+    for n in range(count):
+        (<double *>dst)[0] = (<double *>src)[0]
+        (<double *>dst)[1] = -(<double *>src)[1]
+        dst += dst_stride
+        src += src_stride
+
+# Long double precision
+cdef void _conjugate_line_longdouble(char *dst, Py_ssize_t dst_stride,
+        char *src, Py_ssize_t src_stride, Py_ssize_t count) nogil:
+
+    cdef Py_ssize_t n
+
+    for n in range(count):
+        (<long double *>dst)[0] = (<long double *>src)[0]
+        (<long double *>dst)[1] = -(<long double *>src)[1]
+        dst += dst_stride
+        src += src_stride
+
+ctypedef void (*_generic_conjugate_line)(char *dst, Py_ssize_t dst_stride,
+        char *src, Py_ssize_t src_stride, Py_ssize_t count) nogil
+
+# Conjugate line table (of the same form as the generic precision tables)
+cdef _generic_conjugate_line conjugate_line_funcs[3]
+
+cdef _generic_conjugate_line * _build_conjugate_line_funcs_list():
+    conjugate_line_funcs[0] = &_conjugate_line_double
+    conjugate_line_funcs[1] = &_conjugate_line_float
+    conjugate_line_funcs[2] = &_conjugate_line_longdouble
+
+_build_conjugate_line_funcs_list()
+
+cdef void _hermitian_complete(char *data, int ndim, Py_ssize_t *shape,
+        Py_ssize_t *strides, Py_ssize_t *reflect, Py_ssize_t *index,
+        int last_axis, _generic_conjugate_line conjugate_line) nogil:
+    ''' Fill in the redundant half of the last transformed axis
+    (``last_axis``) of ``data``, which has ``ndim`` dimensions of the
+    given ``shape`` and byte ``strides``. ``reflect`` is non-zero for
+    every transformed axis. ``index`` is scratch space of length ``ndim``.
+    '''
+    cdef Py_ssize_t n = shape[last_axis]
+    cdef Py_ssize_t first = n//2 + 1
+    cdef Py_ssize_t last_stride = strides[last_axis]
+    cdef Py_ssize_t dst_offset, src_offset
+    cdef int d
+
+    if first >= n:
+        return
+
+    for d in range(ndim):
+        # An empty array has nothing to fill in
+        if shape[d] == 0:
+            return
+
+        index[d] = 0
+
+    while True:
+        dst_offset = first * last_stride
+        src_offset = (n - first) * last_stride
+
+        for d in range(ndim):
+            if d == last_axis:
+                continue
+
+            dst_offset += index[d] * strides[d]
+
+            if reflect[d] and index[d] != 0:
+                src_offset += (shape[d] - index[d]) * strides[d]
+            else:
+                src_offset += index[d] * strides[d]
+
+        # Running forwards along the destination, the source runs
+        # backwards through the computed half.
+        conjugate_line(data + dst_offset, last_stride, 
+                data + src_offset, -last_stride, n - first)
+
+        # Move on to the next line
+        d = ndim - 1
+        while d >= 0:
+            if d != last_axis:
+                index[d] += 1
+                if index[d] < shape[d]:
+                    break
+
+                index[d] = 0
+
+            d -= 1
+
+        if d < 0:
+            break
+
 # The External Interface
 # ======================
 #
@@ -607,6 +964,10 @@ cdef class FFTW:
     cdef fftw_generic_execute _fftw_execute
     cdef fftw_generic_destroy_plan _fftw_destroy
     cdef fftw_generic_plan_with_nthreads _nthreads_plan_setter
+    cdef fftw_generic_flops _fftw_flops
+    cdef fftw_generic_cost _fftw_estimate_cost
+    cdef fftw_generic_cost _fftw_cost
+    cdef fftw_generic_fprint_plan _fftw_fprint_plan
 
     # The plan is typecast when it is created or used
     # within the wrapper functions
@@ -633,6 +994,7 @@ cdef class FFTW:
     cdef object _flags_used
 
     cdef double _normalisation_scaling
+    cdef object _norm
 
     cdef int _rank
     cdef _fftw_iodim *_dims
@@ -642,6 +1004,11 @@ cdef class FFTW:
     cdef int64_t *_axes
     cdef int64_t *_not_axes
 
+    cdef bint _hermitian_complete
+    cdef _generic_conjugate_line _conjugate_line
+    cdef int _hermitian_last_axis
+    cdef Py_ssize_t *_hermitian_dims
+
     cdef int64_t _N
     def _get_N(self):
         '''
@@ -787,10 +1154,105 @@ cdef class FFTW:
     
     axes = property(_get_axes)
 
+    def _get_norm(self):
+        '''
+        Return the default normalisation mode that is used by
+        :meth:`~pyfftw.FFTW.__call__`. This is one of ``'backward'``,
+        ``'ortho'``, ``'forward'`` or ``'none'``.
+        '''
+        return self._norm
+
+    norm = property(_get_norm)
+
+    def _get_flops(self):
+        '''
+        Return the number of floating point operations that the plan
+        requires for a single execution, as reported by FFTW's
+        ``fftw_flops()``. This is a tuple of ``(adds, muls, fmas)``, where
+        ``fmas`` is the number of fused multiply-add operations. The total
+        flop count is ``adds + muls + 2*fmas``.
+        '''
+        cdef double add = 0
+        cdef double mul = 0
+        cdef double fma = 0
+
+        self._fftw_flops(self._plan, &add, &mul, &fma)
+
+        return (add, mul, fma)
+
+    flops = property(_get_flops)
+
+    def _get_estimated_cost(self):
+        '''
+        Return FFTW's estimate of the cost of executing the plan, as given
+        by ``fftw_estimate_cost()``. The value is in arbitrary units that 
+        are only meaningful in comparison to the cost of other plans, but
+        it is available irrespective of the planner effort that was used.
+        '''
+        return self._fftw_estimate_cost(self._plan)
+
+    estimated_cost = property(_get_estimated_cost)
+
+    def _get_cost(self):
+        '''
+        Return the cost of executing the plan as measured by the planner,
+        as given by ``fftw_cost()``. This is only known when the plan was
+        measured (that is, it was not created with ``'FFTW_ESTIMATE'`` or 
+        from wisdom), otherwise it is ``0.0``.
+        '''
+        return self._fftw_cost(self._plan)
+
+    cost = property(_get_cost)
+
+    def _get_plan_description(self):
+        '''
+        Return the textual description of the plan that FFTW chose, as
+        written by ``fftw_fprint_plan()``. This is FFTW's internal 
+        representation of the algorithm and its format is not guaranteed to
+        be stable between versions of FFTW.
+        '''
+        cdef FILE *plan_file = tmpfile()
+        cdef long plan_length
+        cdef char *c_plan_description
+
+        if plan_file == NULL:
+            raise IOError('Unable to create a temporary file for writing '
+                    'the plan description.')
+
+        try:
+            self._fftw_fprint_plan(self._plan, plan_file)
+            plan_length = ftell(plan_file)
+            if plan_length < 0:
+                raise IOError('Unable to determine the length of the '
+                        'plan description.')
+
+            rewind(plan_file)
+
+            c_plan_description = <char *>malloc(plan_length + 1)
+            if c_plan_description == NULL:
+                raise MemoryError
+
+            try:
+                plan_length = fread(c_plan_description, 1, plan_length, 
+                        plan_file)
+                c_plan_description[plan_length] = 0
+                py_plan_description = c_plan_description[:plan_length]
+
+            finally:
+                free(c_plan_description)
+
+        finally:
+            fclose(plan_file)
+
+        # str() gives the native string type on both python 2 and 3
+        return str(py_plan_description.decode('ascii'))
+
+    plan_description = property(_get_plan_description)
+
     def __cinit__(self, input_array, output_array, axes=(-1,),
             direction='FFTW_FORWARD', flags=('FFTW_MEASURE',), 
             unsigned int threads=1, planning_timelimit=None,
-            *args, **kwargs):
+            norm=None, *args, **kwargs):
         
         # Initialise the pointers that need to be freed
         self._plan = NULL
@@ -800,8 +1262,12 @@ cdef class FFTW:
         self._axes = NULL
         self._not_axes = NULL
 
+        self._hermitian_dims = NULL
+
         flags = list(flags)
 
+        self._norm = _validate_norm(norm)
+
         cdef double _planning_timelimit
         if planning_timelimit is None:
             _planning_timelimit = FFTW_NO_TIMELIMIT
@@ -843,6 +1309,13 @@ cdef class FFTW:
         self._nthreads_plan_setter = (
                 nthreads_plan_setters[functions['generic_precision']])
 
+        self._fftw_flops = flops_funcs[functions['generic_precision']]
+        self._fftw_estimate_cost = (
+                estimate_cost_funcs[functions['generic_precision']])
+        self._fftw_cost = cost_funcs[functions['generic_precision']]
+        self._fftw_fprint_plan = (
+                fprint_plan_funcs[functions['generic_precision']])
+
         cdef fftw_generic_set_timelimit set_timelimit_func = (
                 set_timelimit_funcs[functions['generic_precision']])
 
@@ -975,6 +1448,39 @@ cdef class FFTW:
 
         self._rank = unique_axes_length
         self._howmany_rank = self._input_array.ndim - unique_axes_length
+
+        # A real to complex transform with the output the same shape as
+        # the input is planned as a normal real to complex transform into
+        # the first part of the output array. The rest of the output is
+        # then filled in from the Hermitian symmetry after every 
+        # execution.
+        cdef int64_t last_axis = self._axes[unique_axes_length - 1]
+        cdef int ndim = self._output_array.ndim
+        cdef int dim
+
+        self._hermitian_complete = (scheme[0] == 'r2c' and 
+                output_array.shape[last_axis] != 
+                input_array.shape[last_axis]//2 + 1)
+
+        if self._hermitian_complete:
+            self._conjugate_line = (
+                    conjugate_line_funcs[functions['generic_precision']])
+            self._hermitian_last_axis = last_axis
+
+            # shape, strides, reflect and index, each of length ndim
+            self._hermitian_dims = <Py_ssize_t *>malloc(
+                    4 * ndim * sizeof(Py_ssize_t))
+
+            if self._hermitian_dims == NULL:
+                raise MemoryError
+
+            for dim in range(ndim):
+                self._hermitian_dims[dim] = output_array.shape[dim]
+                self._hermitian_dims[ndim + dim] = output_array.strides[dim]
+                self._hermitian_dims[2*ndim + dim] = 0
+
+            for dim in range(unique_axes_length):
+                self._hermitian_dims[2*ndim + self._axes[dim]] = 1
         
         self._flags = 0
         self._flags_used = []
@@ -1080,7 +1586,7 @@ cdef class FFTW:
 
     def __init__(self, input_array, output_array, axes=(-1,), 
             direction='FFTW_FORWARD', flags=('FFTW_MEASURE',), 
-            int threads=1, planning_timelimit=None, 
+            int threads=1, planning_timelimit=None, norm=None,
             *args, **kwargs):
         '''
         **Arguments**:
@@ -1159,6 +1665,16 @@ cdef class FFTW:
           <http://www.fftw.org/fftw3_doc/Planner-Flags.html#Planner-Flags>`_
           for more information on this.
 
+        * ``norm`` sets the default normalisation mode that is applied
+          when the object is called through :meth:`~pyfftw.FFTW.__call__`.
+          It is one of ``'backward'`` (the default, in which only the 
+          inverse transform is scaled by 1/N), ``'ortho'`` (in which both
+          directions are scaled by 1/sqrt(N)), ``'forward'`` (in which 
+          only the forward transform is scaled by 1/N) or ``'none'`` (no
+          scaling is ever applied). ``None`` is equivalent to 
+          ``'backward'``. Calling :meth:`~pyfftw.FFTW.execute` directly 
+          never applies any normalisation.
+
         .. _fftw_schemes:
 
         **Schemes**
@@ -1213,6 +1729,13 @@ cdef class FFTW:
           * ``output_array.shape[axes][-1] == input_array.shape[axes][-1]//2 + 1``
           * All the other axes should be equal in length.
 
+          Alternatively, the output array can be the same shape as the 
+          input array, in which case the full complex spectrum is returned
+          (as with a Complex transform of the real input). The transform
+          is still computed as a Real transform, with the redundant part 
+          of the output filled in from the Hermitian symmetry of the 
+          spectrum after every execution.
+
         * For a Real transform in the Backwards direction, both the following 
           should be true:
 
@@ -1290,9 +1813,12 @@ cdef class FFTW:
         if not self._howmany_dims == NULL:
             free(self._howmany_dims)
 
+        if not self._hermitian_dims == NULL:
+            free(self._hermitian_dims)
+
     def __call__(self, input_array=None, output_array=None, 
-            normalise_idft=True):
-        '''__call__(input_array=None, output_array=None, normalise_idft=True)
+            normalise_idft=True, norm=None):
+        '''__call__(input_array=None, output_array=None, normalise_idft=True, norm=None)
 
         Calling the class instance (optionally) updates the arrays, then
         calls :meth:`~pyfftw.FFTW.execute`, before optionally normalising 
@@ -1307,6 +1833,14 @@ cdef class FFTW:
         scaled by 1/N, where N is the product of the lengths of input array on
         which the FFT is taken. If the direction is ``'FFTW_FORWARD'``, this
         flag makes no difference to the output array.
+
+        More generally, the scaling is set by ``norm``, which takes the 
+        same values as the ``norm`` argument to :class:`~pyfftw.FFTW`. If
+        ``norm`` is ``None``, the default mode of the object 
+        (:attr:`~pyfftw.FFTW.norm`) is used, unless ``normalise_idft`` is
+        ``False``, in which case no scaling is applied. Any scaling is 
+        applied in place to the output array in a single pass without
+        the GIL.
         
         When ``input_array`` is something other than None, then the passed in
         array is coerced to be the same dtype as the input array used when the
@@ -1373,6 +1907,13 @@ cdef class FFTW:
                 if not isinstance(input_array, np.ndarray):
                     input_array = np.asanyarray(input_array)
 
+                if self._hermitian_complete and np.iscomplexobj(input_array):
+                    # Casting would silently discard the imaginary part
+                    raise ValueError('Invalid input dtype: '
+                            'The object takes a real transform into a full '
+                            'complex output array, so cannot be called '
+                            'with a complex input array.')
+
                 if not input_array.shape == self._input_shape:
                     raise ValueError('Invalid input shape: '
                             'The new input array should be the same shape '
@@ -1390,10 +1931,22 @@ cdef class FFTW:
             else:
                 self.update_arrays(input_array, output_array)
 
+        if norm is None:
+            if normalise_idft:
+                norm = self._norm
+            else:
+                norm = 'none'
+
+        else:
+            norm = _validate_norm(norm)
+
         self.execute()
 
-        if self._direction == FFTW_BACKWARD and normalise_idft:
-            self._output_array *= self._normalisation_scaling
+        scaling = _normalisation_scaling(norm, self._N, 
+                self._direction == FFTW_BACKWARD)
+
+        if scaling != 1.0:
+            _scale_and_conjugate(self._output_array, scaling, False)
 
         return self._output_array
 
@@ -1542,6 +2095,126 @@ cdef class FFTW:
         else:
             fftw_execute(self._plan, input_pointer, output_pointer)
 
+        cdef int ndim
+        cdef Py_ssize_t *hermitian_dims
+
+        if self._hermitian_complete:
+            ndim = self._output_array.ndim
+            hermitian_dims = self._hermitian_dims
+
+            with nogil:
+                _hermitian_complete(<char *>output_pointer, ndim,
+                        hermitian_dims, hermitian_dims + ndim,
+                        hermitian_dims + 2*ndim, hermitian_dims + 3*ndim,
+                        self._hermitian_last_axis, self._conjugate_line)
+
+cdef _estimate_dummy_array(shape, dtype):
+    ''' Return an array of the passed shape and dtype, with C-contiguous
+    strides, that is backed by a single element of (aligned) memory.
+
+    The array must never be read from or written to; it only exists
+    to describe the memory layout of an array to the FFTW planner when
+    planning with ``FFTW_ESTIMATE`` (which never touches the data).
+    '''
+    dtype = np.dtype(dtype)
+
+    strides = []
+    stride = dtype.itemsize
+    for each_dimension in reversed(shape):
+        strides.insert(0, stride)
+        stride *= each_dimension
+
+    base_array = n_byte_align_empty(1, _simd_alignment, dtype)
+
+    return np.lib.stride_tricks.as_strided(base_array, shape, strides)
+
+def estimate(shape, dtype='complex128', axes=(-1,),
+        direction=None, output_dtype=None, flags=(),
+        unsigned int threads=1):
+    '''estimate(shape, dtype='complex128', axes=(-1,), direction=None, output_dtype=None, flags=(), threads=1)
+
+    Return FFTW's estimate of the cost of the transform described by the
+    arguments, as given by :attr:`pyfftw.FFTW.estimated_cost`, without
+    allocating the input and output arrays.
+
+    ``shape`` and ``dtype`` describe the input array, which is assumed to
+    be C-contiguous and simd aligned. If ``output_dtype`` is ``None``,
+    the output dtype is the same as ``dtype`` for a complex input, and
+    the complex complement of ``dtype`` for a real input (that is, a
+    real forward transform). A complex to real transform is described by
+    passing a real ``output_dtype``, in which case the length of the
+    output along the last transform axis is inferred as per
+    :func:`numpy.fft.irfftn`.
+
+    ``axes``, ``direction``, ``flags`` and ``threads`` are as per
+    :class:`pyfftw.FFTW`. If ``direction`` is ``None``, the first valid
+    direction for the scheme is used (that is, ``'FFTW_FORWARD'`` unless
+    the transform is complex to real). The planner effort is always
+    ``'FFTW_ESTIMATE'``; any other planner effort in ``flags`` is
+    ignored.
+
+    The planner is run with ``'FFTW_ESTIMATE'``, so this is cheap and
+    does not depend on the accumulated wisdom. The returned value is in
+    the same arbitrary units as :attr:`pyfftw.FFTW.estimated_cost`, and so
+    is useful for comparing different transform sizes, such as when
+    choosing a batch size.
+    '''
+    input_dtype = np.dtype(dtype)
+    input_shape = tuple(shape)
+
+    if output_dtype is None:
+        if input_dtype.char in ('f', 'd', 'g'):
+            output_dtype = np.dtype(input_dtype.char.upper())
+        else:
+            output_dtype = input_dtype
+    else:
+        output_dtype = np.dtype(output_dtype)
+
+    try:
+        scheme = fftw_schemes[(input_dtype, output_dtype)]
+    except KeyError:
+        raise ValueError('Invalid scheme: '
+                'The output dtype and input dtype '
+                'do not correspond to a valid fftw scheme.')
+
+    if direction is None:
+        direction = scheme_directions[scheme][0]
+
+    output_shape = list(input_shape)
+
+    if scheme[0] != 'c2c':
+        # Find the last of the unique axes, which is the axis along which
+        # the real transform has a different length.
+        unique_axes = []
+        for each_axis in axes:
+            try:
+                each_axis = range(len(input_shape))[each_axis]
+            except IndexError:
+                raise IndexError('Invalid axes: '
+                    'The axes list cannot contain invalid axes.')
+
+            if each_axis not in unique_axes:
+                unique_axes.append(each_axis)
+
+        last_axis = unique_axes[-1]
+
+        if scheme[0] == 'r2c':
+            output_shape[last_axis] = input_shape[last_axis]//2 + 1
+        else:
+            output_shape[last_axis] = 2*(input_shape[last_axis] - 1)
+
+    estimate_flags = [flag for flag in flags if flag in
+            ('FFTW_UNALIGNED', 'FFTW_DESTROY_INPUT')]
+    estimate_flags.append('FFTW_ESTIMATE')
+
+    input_array = _estimate_dummy_array(input_shape, input_dtype)
+    output_array = _estimate_dummy_array(tuple(output_shape), output_dtype)
+
+    fftw_object = FFTW(input_array, output_array, axes, direction,
+            estimate_flags, threads)
+
+    return fftw_object.estimated_cost
+
 cdef void count_char(char c, void *counter_ptr):
     '''
     On every call, increment the derefenced counter_ptr.
@@ -472,6 +472,46 @@ class BuildersTestFFT(unittest.TestCase):
 
                 self.assertTrue(type(FFTW_object) == FFTW)
 
+    def test_real_input_to_complex_transform(self):
+        '''Test that real input to a forward complex transform is 
+        planned as a real transform (with a full sized output).
+        '''
+        if self.func not in ('fft', 'fft2', 'fftn'):
+            self.skipTest('Only meaningful for the forward complex '
+                    'transforms.')
+
+        dtype_tuple = io_dtypes['r2c']
+        for dtype in dtype_tuple[0]:
+            for test_shape, s, kwargs in self.test_data:
+                s = None
+
+                FFTW_object = self.validate_pyfftw_object(dtype_tuple[1], 
+                        test_shape, dtype, s, kwargs)
+
+                self.assertEqual(FFTW_object.input_dtype, 
+                        numpy.dtype(dtype))
+                self.assertEqual(FFTW_object.output_dtype.char,
+                        numpy.dtype(dtype).char.upper())
+                self.assertEqual(FFTW_object.output_shape, test_shape)
+
+    def test_real_input_object_called_with_complex_fails(self):
+        '''Test that an object planned from real input refuses complex
+        input, rather than discarding the imaginary part.
+        '''
+        if self.func not in ('fft', 'fft2', 'fftn'):
+            self.skipTest('Only meaningful for the forward complex '
+                    'transforms.')
+
+        for test_shape, s, kwargs in self.test_data:
+            real_input = make_real_data(test_shape, numpy.float64)
+            complex_input = make_complex_data(test_shape, numpy.complex128)
+
+            FFTW_object = getattr(builders, self.func)(
+                    real_input, s, **kwargs)
+
+            self.assertRaisesRegex(ValueError, 'Invalid input dtype',
+                    FFTW_object, complex_input)
+
     def test_persistent_padding(self):
         '''Test to confirm the padding it not touched after creation.
         '''
@@ -1057,6 +1097,21 @@ class BuildersTestFFTWWrapper(unittest.TestCase):
             self.input_array[self.input_array_slicer], 
             _input_array[self.FFTW_array_slicer]))
 
+    def test_call_real_input_full_output_with_complex_fails(self):
+        real_internal_array = n_byte_align_empty(self.internal_array.shape,
+                simd_alignment, dtype='float64')
+
+        fft = utils._FFTWWrapper(real_internal_array, self.output_array,
+                input_array_slicer=(slice(None), slice(256)),
+                FFTW_array_slicer=(slice(128), slice(None)))
+
+        # Real input is fine...
+        fft(self.input_array.real)
+
+        # ...but complex input is refused.
+        self.assertRaisesRegex(ValueError, 'Invalid input dtype',
+                fft, self.input_array)
+
 
 class BuildersTestUtilities(unittest.TestCase):
 
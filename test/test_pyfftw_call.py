@@ -377,6 +377,92 @@ class FFTWCallTest(unittest.TestCase):
         # Scaling is performed by default
         self.assertTrue(numpy.allclose(self.input_array, _input_array))
 
+    def test_call_with_norm_modes(self):
+        _input_array = n_byte_align_empty((256, 512), 16,
+                dtype='complex128')
+
+        ifft = FFTW(self.output_array, _input_array, 
+                direction='FFTW_BACKWARD')
+
+        ref_output = numpy.fft.fft(self.input_array)
+        N = self.fft.N
+
+        expected_fwd_scaling = {'backward': 1.0, 'ortho': 1.0/numpy.sqrt(N),
+                'forward': 1.0/N, 'none': 1.0}
+
+        expected_bwd_scaling = {'backward': 1.0/N, 'ortho': 1.0/numpy.sqrt(N),
+                'forward': 1.0, 'none': 1.0}
+
+        for norm in ('backward', 'ortho', 'forward', 'none'):
+            self.fft(norm=norm)
+            self.assertTrue(numpy.allclose(self.output_array, 
+                ref_output * expected_fwd_scaling[norm]))
+
+            ifft(norm=norm)
+            self.assertTrue(numpy.allclose(_input_array, 
+                self.input_array * expected_fwd_scaling[norm] * 
+                expected_bwd_scaling[norm] * N))
+
+    def test_call_with_norm_overrides_normalise_idft(self):
+        _input_array = n_byte_align_empty((256, 512), 16,
+                dtype='complex128')
+
+        ifft = FFTW(self.output_array, _input_array, 
+                direction='FFTW_BACKWARD')
+
+        self.fft()
+        ifft(normalise_idft=False, norm='backward')
+
+        self.assertTrue(numpy.allclose(self.input_array, _input_array))
+
+    def test_default_norm(self):
+        _input_array = n_byte_align_empty((256, 512), 16,
+                dtype='complex128')
+
+        self.assertEqual(self.fft.norm, 'backward')
+
+        ifft = FFTW(self.output_array, _input_array, 
+                direction='FFTW_BACKWARD', norm='ortho')
+
+        self.assertEqual(ifft.norm, 'ortho')
+
+        fft = FFTW(self.input_array, self.output_array, norm='ortho')
+
+        self.input_array[:] = (numpy.random.randn(*self.input_array.shape) 
+                + 1j*numpy.random.randn(*self.input_array.shape))
+
+        fft()
+        ifft()
+
+        self.assertTrue(numpy.allclose(self.input_array, _input_array))
+
+        # normalise_idft=False disables the default scaling
+        fft(normalise_idft=False)
+        self.assertTrue(numpy.allclose(self.output_array, 
+            numpy.fft.fft(self.input_array)))
+
+    def test_invalid_norm(self):
+        self.assertRaisesRegex(ValueError, 'Invalid norm',
+                FFTW, self.input_array, self.output_array, norm='bad')
+
+        self.assertRaisesRegex(ValueError, 'Invalid norm',
+                self.fft, norm='bad')
+
+    def test_call_with_norm_on_real_output(self):
+        real_array = n_byte_align_empty((256, 512), 16, dtype='float64')
+        complex_array = n_byte_align_empty((256, 257), 16, 
+                dtype='complex128')
+
+        irfft = FFTW(complex_array, real_array, 
+                direction='FFTW_BACKWARD')
+
+        complex_array[:] = numpy.fft.rfft(numpy.random.randn(256, 512))
+        ref_output = numpy.fft.irfft(complex_array, norm='ortho')
+
+        irfft(norm='ortho')
+
+        self.assertTrue(numpy.allclose(real_array, ref_output))
+
         
 test_cases = (
         FFTWCallTest,)
@@ -327,6 +327,69 @@ class FFTWMiscTest(unittest.TestCase):
         new_fft = FFTW(self.input_array, self.output_array, axes=(0,))
         self.assertEqual(new_fft.axes, (0,))
 
+    def test_flops_property(self):
+        '''Test to see if the flops property returns a sane flop count
+        '''
+        flops = self.fft.flops
+
+        self.assertEqual(len(flops), 3)
+        self.assertTrue(all(each_count >= 0 for each_count in flops))
+
+        # A transform along both axes needs more operations than a
+        # transform along just one of them.
+        new_fft = FFTW(self.input_array, self.output_array, axes=(0, 1))
+        self.assertTrue(sum(new_fft.flops) > sum(flops))
+
+    def test_cost_properties(self):
+        '''Test to see if the cost properties return sane values
+        '''
+        self.assertTrue(self.fft.estimated_cost > 0)
+        self.assertTrue(self.fft.cost >= 0)
+
+        new_fft = FFTW(self.input_array, self.output_array, axes=(0, 1),
+                flags=('FFTW_ESTIMATE',))
+        self.assertTrue(new_fft.estimated_cost > 0)
+
+    def test_plan_description_property(self):
+        '''Test to see if the plan_description property returns the plan
+        '''
+        description = self.fft.plan_description
+
+        self.assertTrue(isinstance(description, str))
+        self.assertTrue(description.startswith('('))
+
+    def test_estimate(self):
+        '''Test to see if estimate agrees with the equivalent FFTW object
+        '''
+        fft = FFTW(self.input_array, self.output_array,
+                flags=('FFTW_ESTIMATE',))
+
+        self.assertEqual(pyfftw.estimate(self.input_array.shape,
+            'complex128'), fft.estimated_cost)
+
+        self.assertTrue(pyfftw.estimate((1024,), 'complex128') <
+                pyfftw.estimate((1024, 1024), 'complex128', axes=(0, 1)))
+
+        # A real dtype implies a real forward transform
+        self.assertTrue(pyfftw.estimate((1024,), 'float64') > 0)
+        self.assertTrue(pyfftw.estimate((513,), 'complex128',
+            output_dtype='float64', direction='FFTW_BACKWARD') > 0)
+
+        # The direction is inferred from the scheme when not given
+        self.assertEqual(
+                pyfftw.estimate((513,), 'complex128', output_dtype='float64'),
+                pyfftw.estimate((513,), 'complex128', output_dtype='float64',
+                    direction='FFTW_BACKWARD'))
+        self.assertEqual(pyfftw.estimate((1024,), 'complex128'),
+                pyfftw.estimate((1024,), 'complex128',
+                    direction='FFTW_FORWARD'))
+
+        self.assertRaisesRegex(ValueError, 'Invalid scheme',
+                pyfftw.estimate, (1024,), 'int32')
+
+        self.assertRaisesRegex(IndexError, 'Invalid axes',
+                pyfftw.estimate, (1024,), 'float64', axes=(3,))
+
 test_cases = (
         FFTWMiscTest,)
 
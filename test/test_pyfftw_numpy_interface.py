@@ -625,6 +625,93 @@ class InterfacesNumpyFFTTestIRFFTN(InterfacesNumpyFFTTestFFTN):
     func = 'irfftn'
     realinv = True    
 
+class InterfacesNumpyFFTTestNorm(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+
+        super(InterfacesNumpyFFTTestNorm, self).__init__(*args, **kwargs)
+
+        if not hasattr(self, 'assertRaisesRegex'):
+            self.assertRaisesRegex = self.assertRaisesRegexp
+
+    def test_norm_modes(self):
+
+        for func in functions:
+            if functions[func] == 'r2c':
+                input_array = make_real_data((16, 24), numpy.float64)
+            else:
+                input_array = make_complex_data((16, 24), numpy.complex128)
+
+            for norm in ('backward', 'ortho', 'forward'):
+                try:
+                    np_output = getattr(np_fft, func)(input_array, norm=norm)
+                except (TypeError, ValueError):
+                    self.skipTest('numpy.fft does not support the %s '
+                            'normalisation mode.' % norm)
+
+                output = getattr(interfaces.numpy_fft, func)(
+                        input_array, norm=norm)
+
+                self.assertTrue(numpy.allclose(output, np_output),
+                        msg='%s, norm=%s' % (func, norm))
+
+    def test_none_norm(self):
+        input_array = make_complex_data((16, 24), numpy.complex128)
+
+        output = interfaces.numpy_fft.ifft(input_array, norm='none')
+        self.assertTrue(numpy.allclose(output, 
+            np_fft.ifft(input_array) * 24))
+
+        real_input = make_real_data((16, 24), numpy.float64)
+
+        output = interfaces.numpy_fft.ihfft(real_input, norm='none')
+        self.assertTrue(numpy.allclose(output, 
+            np_fft.ihfft(real_input) * 24))
+
+    def test_hfft_input_maintained(self):
+        input_array = make_complex_data((16, 13), numpy.complex128)
+        orig_input_array = input_array.copy()
+
+        interfaces.numpy_fft.hfft(input_array, norm='ortho')
+
+        self.assertTrue(numpy.all(input_array == orig_input_array))
+
+    def test_hfft_repeated_calls(self):
+        # With the cache enabled, the conjugate is loaded into the 
+        # cached object's input array on subsequent calls.
+        interfaces.cache.enable()
+
+        try:
+            for each_input in (make_complex_data((16, 13), numpy.complex128),
+                    numpy.asfortranarray(
+                        make_complex_data((16, 13), numpy.complex128)),
+                    make_complex_data((16, 26), numpy.complex128)[:, ::2]):
+
+                orig_input_array = each_input.copy()
+
+                for n in range(3):
+                    for norm in ('backward', 'ortho', 'forward'):
+                        output = interfaces.numpy_fft.hfft(
+                                each_input, norm=norm)
+
+                        self.assertTrue(numpy.allclose(output, 
+                            np_fft.hfft(orig_input_array, norm=norm)))
+
+                        self.assertTrue(
+                                numpy.all(each_input == orig_input_array))
+
+        finally:
+            interfaces.cache.disable()
+
+    def test_invalid_norm(self):
+        input_array = make_complex_data((16, 24), numpy.complex128)
+
+        for func in ('fft', 'hfft', 'ihfft'):
+            for norm in ('bad', ['ortho'], {}):
+                self.assertRaisesRegex(ValueError, 'Invalid norm',
+                        getattr(interfaces.numpy_fft, func), 
+                        input_array.real, norm=norm)
+
 test_cases = (
         InterfacesNumpyFFTTestModule,
         InterfacesNumpyFFTTestFFT,
@@ -640,7 +727,8 @@ test_cases = (
         InterfacesNumpyFFTTestFFTN,
         InterfacesNumpyFFTTestIFFTN,
         InterfacesNumpyFFTTestRFFTN,
-        InterfacesNumpyFFTTestIRFFTN,)
+        InterfacesNumpyFFTTestIRFFTN,
+        InterfacesNumpyFFTTestNorm,)
 
 #test_set = {'InterfacesNumpyFFTTestHFFT': ('test_valid',)}
 test_set = None
@@ -131,10 +131,126 @@ class RealForwardLongDoubleFFTWTest(RealForwardDoubleFFTWTest):
         a = numpy.float64(a)
         return numpy.fft.rfftn(a, axes=axes)
 
+class RealForwardFullOutputFFTWTest(unittest.TestCase):
+    '''The real forward transform into a full sized (Hermitian symmetric)
+    complex output array.
+    '''
+    dtypes = ((numpy.float32, numpy.complex64),
+            (numpy.float64, numpy.complex128),
+            (numpy.longdouble, numpy.clongdouble))
+
+    test_shapes = (
+            ((16,), (-1,)),
+            ((15,), (-1,)),
+            ((1,), (-1,)),
+            ((2,), (-1,)),
+            ((7, 9), (0, 1)),
+            ((8, 10), (-1,)),
+            ((6, 5, 7), (0, 2)),
+            ((3, 4, 5), (2, 0)),
+            ((5, 1), (0, 1)),
+            ((4, 6, 8, 3), (0, 1, 3)),)
+
+    def __init__(self, *args, **kwargs):
+
+        super(RealForwardFullOutputFFTWTest, self).__init__(*args, **kwargs)
+
+        if not hasattr(self, 'assertRaisesRegex'):
+            self.assertRaisesRegex = self.assertRaisesRegexp
+
+    def validate(self, a, b, axes, **kwargs):
+
+        fft = FFTW(a, b, axes=axes, flags=('FFTW_ESTIMATE',), **kwargs)
+        a[:] = numpy.random.randn(*a.shape)
+
+        fft.execute()
+        ref_b = numpy.fft.fftn(numpy.asarray(a, dtype=numpy.float64), 
+                axes=axes)
+
+        self.assertTrue(numpy.allclose(b, ref_b, rtol=1e-3, atol=1e-3))
+
+        return fft
+
+    def test_shapes_and_axes(self):
+
+        for input_dtype, output_dtype in self.dtypes:
+            for shape, axes in self.test_shapes:
+                a = n_byte_align_empty(shape, 16, dtype=input_dtype)
+                b = n_byte_align_empty(shape, 16, dtype=output_dtype)
+
+                self.validate(a, b, axes)
+
+    def test_non_contiguous(self):
+        a = numpy.random.randn(64, 4, 60)
+        b = numpy.zeros((80, 4, 100), dtype='complex128')
+
+        a_sliced = a[::2, :, 10:50]
+        b_sliced = b[16:48, :, 5:85:2]
+
+        self.validate(a_sliced, b_sliced, (0, 2))
+
+        # The parts of b outside the slice are not touched.
+        self.assertTrue(numpy.all(b[:16] == 0))
+        self.assertTrue(numpy.all(b[16:48, :, 6:85:2] == 0))
+
+    def test_f_contiguous(self):
+        a = numpy.asfortranarray(numpy.random.randn(12, 9))
+        b = numpy.asfortranarray(numpy.zeros((12, 9), dtype='complex128'))
+
+        self.validate(a, b, (0, 1))
+
+    def test_threads(self):
+        a = n_byte_align_empty((64, 66), 16, dtype='float64')
+        b = n_byte_align_empty((64, 66), 16, dtype='complex128')
+
+        self.validate(a, b, (0, 1), threads=2)
+
+    def test_call_with_update(self):
+        a = n_byte_align_empty((32, 18), 16, dtype='float64')
+        b = n_byte_align_empty((32, 18), 16, dtype='complex128')
+
+        fft = self.validate(a, b, (-2, -1))
+
+        new_a = numpy.random.randn(32, 18)
+        output = fft(new_a, norm='ortho')
+
+        self.assertTrue(numpy.allclose(output, 
+            numpy.fft.fft2(new_a, norm='ortho')))
+
+    def test_zero_length_batch(self):
+        # Guard values either side of an empty output, to catch any 
+        # writes outside of it.
+        canary = numpy.ones(32, dtype='complex128')
+
+        a = numpy.zeros((0, 8))
+        b = canary[8:8].reshape(0, 8)
+
+        fft = FFTW(a, b, flags=('FFTW_ESTIMATE',))
+        fft()
+
+        self.assertTrue(numpy.all(canary == 1))
+
+    def test_call_with_complex_input_fails(self):
+        a = n_byte_align_empty((32, 18), 16, dtype='float64')
+        b = n_byte_align_empty((32, 18), 16, dtype='complex128')
+
+        fft = self.validate(a, b, (-2, -1))
+
+        self.assertRaisesRegex(ValueError, 'Invalid input dtype',
+                fft, numpy.ones((32, 18), dtype='complex128'))
+
+    def test_invalid_shape(self):
+        a = n_byte_align_empty((32, 18), 16, dtype='float64')
+        b = n_byte_align_empty((32, 17), 16, dtype='complex128')
+
+        self.assertRaisesRegex(ValueError, 'Invalid shapes',
+                FFTW, a, b)
+
 test_cases = (
         RealForwardDoubleFFTWTest,
         RealForwardSingleFFTWTest,
-        RealForwardLongDoubleFFTWTest,)
+        RealForwardLongDoubleFFTWTest,
+        RealForwardFullOutputFFTWTest,)
 
 test_set = None
 
@@ -21,6 +21,7 @@ from .test_pyfftw_base import run_test_suites
 
 import unittest
 import pyfftw
+import numpy
 import platform
 import os
 
@@ -72,6 +73,39 @@ class UtilsTest(unittest.TestCase):
             else:
                 self.assertTrue(pyfftw.simd_alignment == 1)
 
+    def test_scale_and_conjugate(self):
+        _scale_and_conjugate = pyfftw.pyfftw._scale_and_conjugate
+
+        for dtype in ('complex64', 'complex128', 'clongdouble'):
+            a = numpy.asarray(numpy.random.randn(16, 8) 
+                    + 1j*numpy.random.randn(16, 8), dtype=dtype)
+            orig_a = a.copy()
+
+            # out-of-place, contiguous
+            out = numpy.empty_like(a)
+            _scale_and_conjugate(a, 0.5, True, out)
+            self.assertTrue(numpy.allclose(out, 0.5 * orig_a.conj()))
+            self.assertTrue(numpy.all(a == orig_a))
+
+            # out-of-place, non-contiguous
+            out = numpy.zeros((16, 16), dtype=dtype)
+            _scale_and_conjugate(a[::2], 2.0, True, out[::2, ::2])
+            self.assertTrue(numpy.allclose(out[::2, ::2], 
+                2.0 * orig_a[::2].conj()))
+            self.assertTrue(numpy.all(out[1::2] == 0))
+
+            # in-place
+            _scale_and_conjugate(a, 3.0, False)
+            self.assertTrue(numpy.allclose(a, 3.0 * orig_a))
+
+        a = numpy.random.randn(8)
+        orig_a = a.copy()
+        _scale_and_conjugate(a, 2.0, True)
+        self.assertTrue(numpy.allclose(a, 2.0 * orig_a))
+
+        self.assertRaises(ValueError, _scale_and_conjugate, 
+                a, 2.0, True, numpy.empty(9))
+
 test_cases = (
         UtilsTest,)
 